@@ -0,0 +1,320 @@
+/*
+coercions.c
+Copyright (C) 2019 the SQLAlchemy authors and contributors <see AUTHORS file>
+
+This module is part of SQLAlchemy and is released under
+the MIT License: http://www.opensource.org/licenses/mit-license.php
+*/
+
+#include <Python.h>
+
+#define MODULE_NAME "ccoercions"
+#define MODULE_DOC "Module containing C versions of SQL coercion functions."
+
+/*
+    The dictionary of role -> bindings tuple and the
+    (ClauseElement, SchemaItem) tuple, as established by
+    sqlalchemy.sql.coercions.
+ */
+static PyObject *expect_bindings = NULL;
+static PyObject *clause_or_schema = NULL;
+
+static PyObject *
+setup(PyObject *self, PyObject *args)
+{
+	PyObject *bindings, *types;
+
+	if (!PyArg_UnpackTuple(args, "_setup", 2, 2, &bindings, &types)) {
+		return NULL;
+	}
+
+	if (!PyDict_Check(bindings) || !PyTuple_Check(types)) {
+		PyErr_SetString(PyExc_TypeError,
+			"_setup() expects a dictionary and a tuple");
+		return NULL;
+	}
+
+	Py_INCREF(bindings);
+	Py_XDECREF(expect_bindings);
+	expect_bindings = bindings;
+
+	Py_INCREF(types);
+	Py_XDECREF(clause_or_schema);
+	clause_or_schema = types;
+
+	Py_RETURN_NONE;
+}
+
+/*
+    Call fn with one or two positional arguments and the given keyword
+    arguments, which may be NULL.
+ */
+static PyObject *
+call_with_kw(PyObject *fn, PyObject *arg1, PyObject *arg2, PyObject *kwds)
+{
+	PyObject *args, *result;
+
+	if (arg2 == NULL) {
+		args = PyTuple_Pack(1, arg1);
+	}
+	else {
+		args = PyTuple_Pack(2, arg1, arg2);
+	}
+	if (args == NULL) {
+		return NULL;
+	}
+
+	if (kwds != NULL && PyDict_Size(kwds) == 0) {
+		kwds = NULL;
+	}
+
+	result = PyObject_Call(fn, args, kwds);
+	Py_DECREF(args);
+	return result;
+}
+
+/*
+    Remove the named argument from the given keyword arguments, which
+    are owned by the caller of this function, returning a new reference.
+ */
+static PyObject *
+pop_keyword(PyObject *kwds, const char *name)
+{
+	PyObject *value;
+
+	if (kwds == NULL) {
+		value = NULL;
+	}
+	else {
+		value = PyDict_GetItemString(kwds, name);
+	}
+
+	if (value == NULL) {
+		PyErr_Format(PyExc_TypeError,
+			"expect() missing required argument '%s'", name);
+		return NULL;
+	}
+
+	Py_INCREF(value);
+	if (PyDict_DelItemString(kwds, name) == -1) {
+		Py_DECREF(value);
+		return NULL;
+	}
+	return value;
+}
+
+/*
+    Raise TypeError if the named argument, already passed positionally,
+    is also present in the given keyword arguments.
+ */
+static int
+check_duplicate(PyObject *kwds, const char *name)
+{
+	if (kwds != NULL && PyDict_GetItemString(kwds, name) != NULL) {
+		PyErr_Format(PyExc_TypeError,
+			"expect() got multiple values for argument '%s'", name);
+		return -1;
+	}
+	return 0;
+}
+
+static PyObject *
+expect_impl(PyObject *role, PyObject *element, PyObject *kwds);
+
+/*
+    Equivalent to the pure Python expect() in sqlalchemy.sql.coercions.
+ */
+static PyObject *
+expect(PyObject *self, PyObject *args, PyObject *kwds)
+{
+	PyObject *role, *element, *result;
+	Py_ssize_t nargs;
+
+	nargs = PyTuple_Size(args);
+	if (nargs > 2) {
+		PyErr_Format(PyExc_TypeError,
+			"expect() takes 2 positional arguments but %zd were given",
+			nargs);
+		return NULL;
+	}
+	if (nargs >= 1 && check_duplicate(kwds, "role") == -1) {
+		return NULL;
+	}
+	if (nargs == 2) {
+		if (check_duplicate(kwds, "element") == -1) {
+			return NULL;
+		}
+		return expect_impl(
+			PyTuple_GET_ITEM(args, 0), PyTuple_GET_ITEM(args, 1), kwds);
+	}
+
+	/* role and / or element were passed as keywords; work on a copy of
+	   the keyword arguments so that the caller's dictionary isn't
+	   modified */
+	kwds = kwds == NULL ? PyDict_New() : PyDict_Copy(kwds);
+	if (kwds == NULL) {
+		return NULL;
+	}
+
+	if (nargs == 1) {
+		role = PyTuple_GET_ITEM(args, 0);
+		Py_INCREF(role);
+	}
+	else {
+		role = pop_keyword(kwds, "role");
+		if (role == NULL) {
+			Py_DECREF(kwds);
+			return NULL;
+		}
+	}
+
+	element = pop_keyword(kwds, "element");
+	if (element == NULL) {
+		Py_DECREF(role);
+		Py_DECREF(kwds);
+		return NULL;
+	}
+
+	result = expect_impl(role, element, kwds);
+	Py_DECREF(role);
+	Py_DECREF(element);
+	Py_DECREF(kwds);
+	return result;
+}
+
+static PyObject *
+expect_impl(PyObject *role, PyObject *element, PyObject *kwds)
+{
+	PyObject *binding, *resolved, *result;
+	PyObject *resolve_for_clause_element, *role_class;
+	PyObject *post_coercion, *implicit_coercions;
+	int has_post_coercion, is_instance;
+
+	if (expect_bindings == NULL) {
+		PyErr_SetString(PyExc_RuntimeError,
+			"coercions have not been set up");
+		return NULL;
+	}
+
+#if PY_MAJOR_VERSION >= 3
+	binding = PyDict_GetItemWithError(expect_bindings, role);
+#else
+	binding = PyDict_GetItem(expect_bindings, role);
+#endif
+	if (binding == NULL) {
+		if (!PyErr_Occurred()) {
+			PyErr_SetObject(PyExc_KeyError, role);
+		}
+		return NULL;
+	}
+	if (!PyTuple_Check(binding) || PyTuple_GET_SIZE(binding) != 5) {
+		PyErr_SetString(PyExc_TypeError, "invalid coercion binding");
+		return NULL;
+	}
+	/* the borrowed reference is held across calls back into Python */
+	Py_INCREF(binding);
+
+	resolve_for_clause_element = PyTuple_GET_ITEM(binding, 0);
+	role_class = PyTuple_GET_ITEM(binding, 1);
+	post_coercion = PyTuple_GET_ITEM(binding, 3);
+	implicit_coercions = PyTuple_GET_ITEM(binding, 4);
+
+	has_post_coercion = PyObject_IsTrue(PyTuple_GET_ITEM(binding, 2));
+	if (has_post_coercion == -1) {
+		goto error;
+	}
+
+	is_instance = PyObject_IsInstance(element, clause_or_schema);
+	if (is_instance == -1) {
+		goto error;
+	}
+
+	if (is_instance) {
+		Py_INCREF(element);
+		resolved = element;
+	}
+	else {
+		resolved = call_with_kw(
+			resolve_for_clause_element, element, NULL, kwds);
+		if (resolved == NULL) {
+			goto error;
+		}
+	}
+
+	is_instance = PyObject_IsInstance(resolved, role_class);
+	if (is_instance == -1) {
+		Py_DECREF(resolved);
+		goto error;
+	}
+
+	if (is_instance) {
+		if (!has_post_coercion) {
+			Py_DECREF(binding);
+			return resolved;
+		}
+		result = call_with_kw(post_coercion, resolved, NULL, kwds);
+	}
+	else {
+		result = call_with_kw(implicit_coercions, element, resolved, kwds);
+	}
+
+	Py_DECREF(resolved);
+	Py_DECREF(binding);
+	return result;
+
+error:
+	Py_DECREF(binding);
+	return NULL;
+}
+
+static PyMethodDef module_methods[] = {
+    {"_setup", setup, METH_VARARGS,
+     "Establish the role bindings used by expect()."},
+    {"expect", (PyCFunction)expect, METH_VARARGS | METH_KEYWORDS,
+     "Coerce the given element into the given role."},
+    {NULL, NULL, 0, NULL}        /* Sentinel */
+};
+
+#ifndef PyMODINIT_FUNC  /* declarations for DLL import/export */
+#define PyMODINIT_FUNC void
+#endif
+
+#if PY_MAJOR_VERSION >= 3
+
+#define INITERROR return NULL
+
+static struct PyModuleDef module_def = {
+    PyModuleDef_HEAD_INIT,
+    MODULE_NAME,
+    MODULE_DOC,
+    -1,
+    module_methods
+ };
+
+PyMODINIT_FUNC
+PyInit_ccoercions(void)
+
+#else
+
+#define INITERROR return
+
+PyMODINIT_FUNC
+initccoercions(void)
+
+#endif
+
+{
+    PyObject *m;
+
+#if PY_MAJOR_VERSION >= 3
+    m = PyModule_Create(&module_def);
+#else
+    m = Py_InitModule3(MODULE_NAME, module_methods, MODULE_DOC);
+#endif
+    if (m == NULL)
+        INITERROR;
+
+#if PY_MAJOR_VERSION >= 3
+    return m;
+#endif
+}
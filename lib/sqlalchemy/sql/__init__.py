@@ -109,6 +109,9 @@ def __go(lcls):
     coercions.schema = schema
     coercions.selectable = selectable
     coercions.sqltypes = sqltypes
+    coercions._init_type_tuples()
+    coercions._bind_type_refs()
+    coercions._init_cexpect()
 
     _prepare_annotations(ColumnElement, AnnotatedColumnElement)
     _prepare_annotations(FromClause, AnnotatedFromClause)
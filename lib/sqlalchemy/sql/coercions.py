@@ -5,8 +5,11 @@
 # This module is part of SQLAlchemy and is released under
 # the MIT License: http://www.opensource.org/licenses/mit-license.php
 
+import datetime
+import decimal
 import numbers
 import re
+import uuid
 
 from . import operators
 from . import roles
@@ -22,15 +25,60 @@ schema = None  # type: types.ModuleType
 selectable = None  # type: types.ModuleType
 sqltypes = None  # type: types.ModuleType
 
+# set up by _init_type_tuples() once the modules above are available
+_CLAUSE_OR_SCHEMA = None
+_NON_LITERAL_BASES = None
+
+# exact types that are always literals, checked ahead of the more general
+# isinstance() / hasattr() tests in _is_literal()
+_LITERAL_FAST_TYPES = frozenset(
+    (util.text_type, util.binary_type, float, bool, type(None))
+    + util.int_types
+    + (
+        decimal.Decimal,
+        datetime.date,
+        datetime.datetime,
+        datetime.time,
+        uuid.UUID,
+    )
+)
+
+# classes observed by _is_literal() to not provide __clause_element__ for
+# any of their instances; bounded in size as these are held strongly
+_NO_CLAUSE_ELEMENT_TYPES = set()
+_NO_CLAUSE_ELEMENT_TYPES_MAX = 100
+
 
 def _is_literal(element):
     """Return whether or not the element is a "literal" in the context
     of a SQL expression construct.
 
     """
-    return not isinstance(
-        element, (Visitable, schema.SchemaEventTarget)
-    ) and not hasattr(element, "__clause_element__")
+    t = element.__class__
+    if t in _LITERAL_FAST_TYPES:
+        return True
+    elif isinstance(element, _NON_LITERAL_BASES):
+        return False
+    elif t in _NO_CLAUSE_ELEMENT_TYPES:
+        return True
+    elif hasattr(element, "__clause_element__"):
+        return False
+
+    # only cache classes where no instance can produce __clause_element__
+    # while another doesn't; this excludes instances with a __dict__ or
+    # a __clause_element__ slot, classes with __getattr__ or their own
+    # __getattribute__, as well as class objects themselves, which would
+    # otherwise be keyed on their metaclass
+    if (
+        len(_NO_CLAUSE_ELEMENT_TYPES) < _NO_CLAUSE_ELEMENT_TYPES_MAX
+        and not isinstance(element, type)
+        and not hasattr(element, "__dict__")
+        and not hasattr(t, "__getattr__")
+        and t.__getattribute__ is object.__getattribute__
+        and not hasattr(t, "__clause_element__")
+    ):
+        _NO_CLAUSE_ELEMENT_TYPES.add(t)
+    return True
 
 
 def _document_text_coercion(paramname, meth_rst, param_rst):
@@ -47,22 +95,39 @@ def _document_text_coercion(paramname, meth_rst, param_rst):
     )
 
 
-def expect(role, element, **kw):
-    # major case is that we are given a ClauseElement already, skip more
-    # elaborate logic up front if possible
-    impl = _impl_lookup[role]
+def py_fallback():
+    def expect(role, element, **kw):  # noqa
+        # major case is that we are given a ClauseElement already, skip more
+        # elaborate logic up front if possible
+        (
+            resolve_for_clause_element,
+            role_class,
+            has_post_coercion,
+            post_coercion,
+            implicit_coercions,
+        ) = _expect_bindings[role]
+
+        if isinstance(element, _CLAUSE_OR_SCHEMA):
+            if isinstance(element, role_class):
+                if has_post_coercion:
+                    return post_coercion(element, **kw)
+                return element
+            return implicit_coercions(element, element, **kw)
+
+        # most calls pass no keyword arguments; skip re-packing them
+        if kw:
+            resolved = resolve_for_clause_element(element, **kw)
+        else:
+            resolved = resolve_for_clause_element(element)
 
-    if not isinstance(element, (elements.ClauseElement, schema.SchemaItem)):
-        resolved = impl._resolve_for_clause_element(element, **kw)
-    else:
-        resolved = element
+        if isinstance(resolved, role_class):
+            if has_post_coercion:
+                resolved = post_coercion(resolved, **kw)
+            return resolved
+        else:
+            return implicit_coercions(element, resolved, **kw)
 
-    if issubclass(resolved.__class__, impl._role_class):
-        if impl._post_coercion:
-            resolved = impl._post_coercion(resolved, **kw)
-        return resolved
-    else:
-        return impl._implicit_coercions(element, resolved, **kw)
+    return locals()
 
 
 def expect_as_key(role, element, **kw):
@@ -70,25 +135,50 @@ def expect_as_key(role, element, **kw):
     return expect(role, element, **kw)
 
 
-def expect_col_expression_collection(role, expressions):
-    for expr in expressions:
-        strname = None
-        column = None
+_EMPTY_OPTS = util.immutabledict()
+
 
+def _col_expression_resolver(role):
+    traverse = visitors.traverse
+    string_types = util.string_types
+
+    # a single list and visitor dict is reused for each expression
+    cols = []
+    visitor = {"column": cols.append}
+
+    def resolve(expr):
         resolved = expect(role, expr)
-        if isinstance(resolved, util.string_types):
-            strname = resolved = expr
-        else:
-            cols = []
-            visitors.traverse(resolved, {}, {"column": cols.append})
-            if cols:
-                column = cols[0]
-        add_element = column if column is not None else strname
-        yield resolved, column, strname, add_element
+        if isinstance(resolved, string_types):
+            return expr, None, expr, expr
+
+        del cols[:]
+        traverse(resolved, _EMPTY_OPTS, visitor)
+        column = cols[0] if cols else None
+        return resolved, column, None, column
+
+    return resolve
+
+
+def expect_col_expression_collection(role, expressions):
+    """Coerce a series of column expressions for the given role.
+
+    Returns a list of ``(resolved, column, strname, add_element)`` tuples,
+    one for each expression.
+
+    """
+    resolve = _col_expression_resolver(role)
+    return [resolve(expr) for expr in expressions]
 
 
 class RoleImpl(object):
-    __slots__ = ("_role_class", "name", "_use_inspection")
+    __slots__ = (
+        "_role_class",
+        "name",
+        "_use_inspection",
+        "_literal_coercion_fn",
+        "_clause_or_schema",
+        "_has_post_coercion",
+    )
 
     def _literal_coercion(self, element, **kw):
         raise NotImplementedError()
@@ -99,16 +189,23 @@ class RoleImpl(object):
         self._role_class = role_class
         self.name = role_class._role_name
         self._use_inspection = issubclass(role_class, roles.UsesInspection)
+        self._literal_coercion_fn = self._literal_coercion
+        self._has_post_coercion = self._post_coercion is not None
+
+        # set up by _init_type_tuples()
+        self._clause_or_schema = None
 
     def _resolve_for_clause_element(self, element, argname=None, **kw):
         original_element = element
         is_clause_element = False
 
-        while hasattr(element, "__clause_element__") and not isinstance(
-            element, (elements.ClauseElement, schema.SchemaItem)
+        clause_element = getattr(element, "__clause_element__", None)
+        while clause_element is not None and not isinstance(
+            element, self._clause_or_schema
         ):
-            element = element.__clause_element__()
+            element = clause_element()
             is_clause_element = True
+            clause_element = getattr(element, "__clause_element__", None)
 
         if not is_clause_element:
             if self._use_inspection:
@@ -119,7 +216,7 @@ class RoleImpl(object):
                     except AttributeError:
                         self._raise_for_expected(original_element, argname)
 
-            return self._literal_coercion(element, argname=argname, **kw)
+            return self._literal_coercion_fn(element, argname=argname, **kw)
         else:
             return element
 
@@ -140,7 +237,7 @@ class RoleImpl(object):
 
 class _StringOnly(object):
     def _resolve_for_clause_element(self, element, argname=None, **kw):
-        return self._literal_coercion(element, **kw)
+        return self._literal_coercion_fn(element, **kw)
 
 
 class _ReturnsStringKey(object):
@@ -174,7 +271,7 @@ class _ColumnCoercions(object):
             return resolved.scalar_subquery()
         elif (
             resolved._is_from_clause
-            and isinstance(resolved, selectable.Alias)
+            and isinstance(resolved, self._Alias)
             and resolved.element._is_select_statement
         ):
             self._warn_for_scalar_subquery_coercion()
@@ -200,7 +297,7 @@ def _no_text_coercion(
 class _NoTextCoercion(object):
     def _literal_coercion(self, element, argname=None, **kw):
         if isinstance(element, util.string_types) and issubclass(
-            elements.TextClause, self._role_class
+            self._TextClause, self._role_class
         ):
             _no_text_coercion(element, argname)
         else:
@@ -212,26 +309,64 @@ class _CoerceLiterals(object):
     _coerce_star = False
     _coerce_numerics = False
 
+    def __init__(self, role_class):
+        super(_CoerceLiterals, self).__init__(role_class)
+
+        # the exact types of literal values accepted by this impl, mapped
+        # to the method that coerces them.  values of other types, such as
+        # subclasses of str, go through the general isinstance() tests in
+        # _literal_coercion().
+        dispatch = {}
+        if self._coerce_numerics:
+            for type_ in util.int_types + (
+                float,
+                complex,
+                decimal.Decimal,
+                bool,
+            ):
+                dispatch[type_] = self._numeric_coercion
+        if self._coerce_consts:
+            dispatch[type(None)] = self._none_coercion
+            dispatch[bool] = self._bool_coercion
+        for type_ in (str, util.text_type):
+            dispatch[type_] = (
+                self._string_coercion
+                if self._coerce_star
+                else self._text_coercion
+            )
+        self._literal_dispatch = dispatch
+
     def _text_coercion(self, element, argname=None):
         return _no_text_coercion(element, argname)
 
-    def _literal_coercion(self, element, argname=None, **kw):
-        if isinstance(element, util.string_types):
-            if self._coerce_star and element == "*":
-                return elements.ColumnClause("*", is_literal=True)
-            else:
-                return self._text_coercion(element, argname)
+    def _string_coercion(self, element, argname=None):
+        if self._coerce_star and element == "*":
+            return self._ColumnClause("*", is_literal=True)
+        else:
+            return self._text_coercion(element, argname)
 
-        if self._coerce_consts:
-            if element is None:
-                return elements.Null()
-            elif element is False:
-                return elements.False_()
-            elif element is True:
-                return elements.True_()
+    def _none_coercion(self, element, argname=None):
+        return self._Null()
+
+    def _bool_coercion(self, element, argname=None):
+        if element:
+            return self._True()
+        else:
+            return self._False()
 
-        if self._coerce_numerics and isinstance(element, (numbers.Number)):
-            return elements.ColumnClause(str(element), is_literal=True)
+    def _numeric_coercion(self, element, argname=None):
+        return self._ColumnClause(str(element), is_literal=True)
+
+    def _literal_coercion(self, element, argname=None, **kw):
+        handler = self._literal_dispatch.get(element.__class__)
+        if handler is not None:
+            return handler(element, argname)
+
+        # None and bool can't be subclassed, so aren't tested here
+        if isinstance(element, util.string_types):
+            return self._string_coercion(element, argname)
+        elif self._coerce_numerics and isinstance(element, numbers.Number):
+            return self._numeric_coercion(element, argname)
 
         self._raise_for_expected(element, argname)
 
@@ -243,12 +378,10 @@ class ExpressionElementImpl(
         self, element, name=None, type_=None, argname=None, **kw
     ):
         if element is None:
-            return elements.Null()
+            return self._Null()
         else:
             try:
-                return elements.BindParameter(
-                    name, element, type_, unique=True
-                )
+                return self._BindParameter(name, element, type_, unique=True)
             except exc.ArgumentError:
                 self._raise_for_expected(element)
 
@@ -265,10 +398,7 @@ class BinaryElementImpl(
             self._raise_for_expected(element)
 
     def _post_coercion(self, resolved, expr, **kw):
-        if (
-            isinstance(resolved, elements.BindParameter)
-            and resolved.type._isnull
-        ):
+        if isinstance(resolved, self._BindParameter) and resolved.type._isnull:
             resolved = resolved._clone()
             resolved.type = expr.type
         return resolved
@@ -280,7 +410,7 @@ class InElementImpl(RoleImpl, roles.InElementRole):
     ):
         if resolved._is_from_clause:
             if (
-                isinstance(resolved, selectable.Alias)
+                isinstance(resolved, self._Alias)
                 and resolved.element._is_select_statement
             ):
                 return resolved.element
@@ -293,18 +423,23 @@ class InElementImpl(RoleImpl, roles.InElementRole):
         if isinstance(element, collections_abc.Iterable) and not isinstance(
             element, util.string_types
         ):
+            bind_param = expr._bind_param
+            Null = self._Null
+            ColumnOperators = operators.ColumnOperators
+
             args = []
+            append = args.append
             for o in element:
                 if not _is_literal(o):
-                    if not isinstance(o, operators.ColumnOperators):
+                    if not isinstance(o, ColumnOperators):
                         self._raise_for_expected(element, **kw)
+                    append(o)
                 elif o is None:
-                    o = elements.Null()
+                    append(Null())
                 else:
-                    o = expr._bind_param(operator, o)
-                args.append(o)
+                    append(bind_param(operator, o))
 
-            return elements.ClauseList(*args)
+            return self._ClauseList(*args)
 
         else:
             self._raise_for_expected(element, **kw)
@@ -312,7 +447,7 @@ class InElementImpl(RoleImpl, roles.InElementRole):
     def _post_coercion(self, element, expr, operator, **kw):
         if element._is_select_statement:
             return element.scalar_subquery()
-        elif isinstance(element, elements.ClauseList):
+        elif isinstance(element, self._ClauseList):
             if len(element.clauses) == 0:
                 op, negate_op = (
                     (operators.empty_in_op, operators.empty_notin_op)
@@ -325,9 +460,9 @@ class InElementImpl(RoleImpl, roles.InElementRole):
             else:
                 return element.self_group(against=operator)
 
-        elif isinstance(element, elements.BindParameter) and element.expanding:
+        elif isinstance(element, self._BindParameter) and element.expanding:
 
-            if isinstance(expr, elements.Tuple):
+            if isinstance(expr, self._Tuple):
                 element = element._with_expanding_in_types(
                     [elem.type for elem in expr]
                 )
@@ -353,7 +488,7 @@ class StatementOptionImpl(
     _coerce_consts = True
 
     def _text_coercion(self, element, argname=None):
-        return elements.TextClause(element)
+        return self._TextClause(element)
 
 
 class ColumnArgumentImpl(_NoTextCoercion, RoleImpl, roles.ColumnArgumentRole):
@@ -371,7 +506,7 @@ class ByOfImpl(_CoerceLiterals, _ColumnCoercions, RoleImpl, roles.ByOfRole):
     _coerce_consts = True
 
     def _text_coercion(self, element, argname=None):
-        return elements._textual_label_reference(element)
+        return self._textual_label_reference(element)
 
 
 class OrderByImpl(ByOfImpl, RoleImpl, roles.OrderByRole):
@@ -380,7 +515,7 @@ class OrderByImpl(ByOfImpl, RoleImpl, roles.OrderByRole):
             isinstance(resolved, self._role_class)
             and resolved._order_by_label_element is not None
         ):
-            return elements._label_reference(resolved)
+            return self._label_reference(resolved)
         else:
             return resolved
 
@@ -396,11 +531,11 @@ class DMLColumnImpl(_ReturnsStringKey, RoleImpl, roles.DMLColumnRole):
 class ConstExprImpl(RoleImpl, roles.ConstExprRole):
     def _literal_coercion(self, element, argname=None, **kw):
         if element is None:
-            return elements.Null()
+            return self._Null()
         elif element is False:
-            return elements.False_()
+            return self._False()
         elif element is True:
-            return elements.True_()
+            return self._True()
         else:
             self._raise_for_expected(element, argname)
 
@@ -422,10 +557,10 @@ class TruncatedLabelImpl(_StringOnly, RoleImpl, roles.TruncatedLabelRole):
         unchanged.
         """
 
-        if isinstance(element, elements._truncated_label):
+        if isinstance(element, self._truncated_label):
             return element
         else:
-            return elements._truncated_label(element)
+            return self._truncated_label(element)
 
 
 class DDLExpressionImpl(_CoerceLiterals, RoleImpl, roles.DDLExpressionRole):
@@ -433,7 +568,7 @@ class DDLExpressionImpl(_CoerceLiterals, RoleImpl, roles.DDLExpressionRole):
     _coerce_consts = True
 
     def _text_coercion(self, element, argname=None):
-        return elements.TextClause(element)
+        return self._TextClause(element)
 
 
 class DDLConstraintColumnImpl(
@@ -453,8 +588,9 @@ class LimitOffsetImpl(RoleImpl, roles.LimitOffsetRole):
         if element is None:
             return None
         else:
-            value = util.asint(element)
-            return selectable._OffsetLimitParam(
+            # equivalent to util.asint(), as None is handled above
+            value = element if element.__class__ is int else int(element)
+            return self._OffsetLimitParam(
                 name, value, type_=type_, unique=True
             )
 
@@ -484,11 +620,12 @@ class ColumnsClauseImpl(_CoerceLiterals, RoleImpl, roles.ColumnsClauseRole):
     _coerce_star = True
 
     _guess_straight_column = re.compile(r"^\w\S*$", re.I)
+    _guess_straight_column_match = _guess_straight_column.match
 
     def _text_coercion(self, element, argname=None):
         element = str(element)
 
-        guess_is_literal = not self._guess_straight_column.match(element)
+        guess_is_literal = not self._guess_straight_column_match(element)
         raise exc.ArgumentError(
             "Textual column expression %(column)r %(argname)sshould be "
             "explicitly declared with text(%(column)r), "
@@ -514,7 +651,7 @@ class StatementImpl(_NoTextCoercion, RoleImpl, roles.StatementRole):
 
 class CoerceTextStatementImpl(_CoerceLiterals, RoleImpl, roles.StatementRole):
     def _text_coercion(self, element, argname=None):
-        return elements.TextClause(element)
+        return self._TextClause(element)
 
 
 class SelectStatementImpl(
@@ -577,7 +714,7 @@ class DMLSelectImpl(_NoTextCoercion, RoleImpl, roles.DMLSelectRole):
     ):
         if resolved._is_from_clause:
             if (
-                isinstance(resolved, selectable.Alias)
+                isinstance(resolved, self._Alias)
                 and resolved.element._is_select_statement
             ):
                 return resolved.element
@@ -597,13 +734,191 @@ class CompoundElementImpl(
             self._raise_for_expected(original_element, argname)
 
 
-_impl_lookup = {}
+_IMPL_PAIRS = (
+    (roles.ColumnArgumentRole, ColumnArgumentImpl),
+    (roles.ColumnArgumentOrKeyRole, ColumnArgumentOrKeyImpl),
+    (roles.TruncatedLabelRole, TruncatedLabelImpl),
+    (roles.ColumnsClauseRole, ColumnsClauseImpl),
+    (roles.LimitOffsetRole, LimitOffsetImpl),
+    (roles.ByOfRole, ByOfImpl),
+    (roles.OrderByRole, OrderByImpl),
+    (roles.StatementOptionRole, StatementOptionImpl),
+    (roles.WhereHavingRole, WhereHavingImpl),
+    (roles.ExpressionElementRole, ExpressionElementImpl),
+    (roles.ConstExprRole, ConstExprImpl),
+    (roles.LabeledColumnExprRole, LabeledColumnExprImpl),
+    (roles.BinaryElementRole, BinaryElementImpl),
+    (roles.InElementRole, InElementImpl),
+    (roles.FromClauseRole, FromClauseImpl),
+    (roles.StrictFromClauseRole, StrictFromClauseImpl),
+    (roles.AnonymizedFromClauseRole, AnonymizedFromClauseImpl),
+    (roles.CoerceTextStatementRole, CoerceTextStatementImpl),
+    (roles.StatementRole, StatementImpl),
+    (roles.ReturnsRowsRole, ReturnsRowsImpl),
+    (roles.SelectStatementRole, SelectStatementImpl),
+    (roles.HasCTERole, HasCTEImpl),
+    (roles.CompoundElementRole, CompoundElementImpl),
+    (roles.DMLColumnRole, DMLColumnImpl),
+    (roles.DMLSelectRole, DMLSelectImpl),
+    (roles.DDLExpressionRole, DDLExpressionImpl),
+    (roles.DDLConstraintColumnRole, DDLConstraintColumnImpl),
+)
+
+_impl_lookup = {role: impl_cls(role) for role, impl_cls in _IMPL_PAIRS}
+
+
+def _register_role_subclasses():
+    """Register roles that don't have an Impl of their own, such as
+    DMLRole, using the Impl of their nearest role superclass.
+
+    """
+    for cls in list(vars(roles).values()):
+        if (
+            isinstance(cls, type)
+            and issubclass(cls, roles.SQLRole)
+            and cls not in _impl_lookup
+        ):
+            for base in cls.__mro__[1:]:
+                if base in _impl_lookup:
+                    _impl_lookup[cls] = type(_impl_lookup[base])(cls)
+                    break
+
+
+_register_role_subclasses()
+
+
+def _flatten_coercion_methods():
+    """Copy the coercion methods called per element from the mixins onto
+    each Impl class itself, so that they're located in the class' own
+    ``__dict__`` rather than further along its MRO.
+
+    """
+    for cls in set(type(impl) for impl in _impl_lookup.values()):
+        for name in (
+            "_resolve_for_clause_element",
+            "_literal_coercion",
+            "_implicit_coercions",
+            "_text_coercion",
+            "_post_coercion",
+        ):
+            if name in cls.__dict__:
+                continue
+            for base in cls.__mro__[1:]:
+                if name in base.__dict__:
+                    setattr(cls, name, base.__dict__[name])
+                    break
+
+
+_flatten_coercion_methods()
+
+
+def _expect_binding(impl):
+    """Return the attributes of a :class:`.RoleImpl` used by
+    :func:`.expect`, pre-bound so that they aren't looked up on the impl
+    for every call.
+
+    """
+    return (
+        impl._resolve_for_clause_element,
+        impl._role_class,
+        impl._has_post_coercion,
+        impl._post_coercion,
+        impl._implicit_coercions,
+    )
+
+
+_expect_bindings = {
+    role: _expect_binding(impl) for role, impl in _impl_lookup.items()
+}
+
+try:
+    from sqlalchemy.ccoercions import _setup as _cexpect_setup
+    from sqlalchemy.ccoercions import expect  # noqa
+except ImportError:
+    _cexpect_setup = None
+    globals().update(py_fallback())
+
+
+def _make_expect(role, impl):
+    """Produce a version of :func:`.expect` specialized for a single role.
+
+    The function is equivalent to ``expect(role, element, **kw)``, however
+    the impl's attributes are held as closure variables, skipping the
+    lookup of the role for callers that always pass the same one.
+
+    """
+    (
+        resolve_for_clause_element,
+        role_class,
+        has_post_coercion,
+        post_coercion,
+        implicit_coercions,
+    ) = _expect_binding(impl)
+
+    def expect(element, **kw):
+        if isinstance(element, _CLAUSE_OR_SCHEMA):
+            if isinstance(element, role_class):
+                if has_post_coercion:
+                    return post_coercion(element, **kw)
+                return element
+            return implicit_coercions(element, element, **kw)
+
+        if kw:
+            resolved = resolve_for_clause_element(element, **kw)
+        else:
+            resolved = resolve_for_clause_element(element)
+
+        if isinstance(resolved, role_class):
+            if has_post_coercion:
+                resolved = post_coercion(resolved, **kw)
+            return resolved
+        else:
+            return implicit_coercions(element, resolved, **kw)
+
+    expect.__name__ = "expect_%s" % role.__name__.replace("Role", "")
+    return expect
+
+
+def _establish_specialized_expect():
+    """Establish expect_WhereHaving(), expect_ExpressionElement(), etc.
+    as module-level functions.
+
+    """
+    for role, impl in _impl_lookup.items():
+        fn = _make_expect(role, impl)
+        globals()[fn.__name__] = fn
+
+
+_establish_specialized_expect()
+
+
+def _init_type_tuples():
+    global _CLAUSE_OR_SCHEMA, _NON_LITERAL_BASES
+
+    _CLAUSE_OR_SCHEMA = (elements.ClauseElement, schema.SchemaItem)
+    _NON_LITERAL_BASES = (Visitable, schema.SchemaEventTarget)
+
+    for impl in _impl_lookup.values():
+        impl._clause_or_schema = _CLAUSE_OR_SCHEMA
+
+
+def _init_cexpect():
+    if _cexpect_setup is not None:
+        _cexpect_setup(_expect_bindings, _CLAUSE_OR_SCHEMA)
 
 
-for name in dir(roles):
-    cls = getattr(roles, name)
-    if name.endswith("Role"):
-        name = name.replace("Role", "Impl")
-        if name in globals():
-            impl = globals()[name](cls)
-            _impl_lookup[cls] = impl
+def _bind_type_refs():
+    for impl in _impl_lookup.values():
+        impl._BindParameter = elements.BindParameter
+        impl._Null = elements.Null
+        impl._False = elements.False_
+        impl._True = elements.True_
+        impl._ColumnClause = elements.ColumnClause
+        impl._TextClause = elements.TextClause
+        impl._ClauseList = elements.ClauseList
+        impl._Tuple = elements.Tuple
+        impl._label_reference = elements._label_reference
+        impl._textual_label_reference = elements._textual_label_reference
+        impl._truncated_label = elements._truncated_label
+        impl._Alias = selectable.Alias
+        impl._OffsetLimitParam = selectable._OffsetLimitParam
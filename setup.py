@@ -32,6 +32,10 @@ ext_modules = [
     Extension(
         "sqlalchemy.cutils", sources=["lib/sqlalchemy/cextension/utils.c"]
     ),
+    Extension(
+        "sqlalchemy.ccoercions",
+        sources=["lib/sqlalchemy/cextension/coercions.c"],
+    ),
 ]
 
 ext_errors = (CCompilerError, DistutilsExecError, DistutilsPlatformError)
@@ -13,13 +13,17 @@ from sqlalchemy.sql import column
 from sqlalchemy.sql import false
 from sqlalchemy.sql import False_
 from sqlalchemy.sql import literal
+from sqlalchemy.sql import literal_column
+from sqlalchemy.sql import quoted_name
 from sqlalchemy.sql import roles
 from sqlalchemy.sql import true
 from sqlalchemy.sql import True_
 from sqlalchemy.sql.coercions import expect
 from sqlalchemy.sql.elements import _truncated_label
 from sqlalchemy.sql.elements import Null
+from sqlalchemy.testing import assert_raises
 from sqlalchemy.testing import assert_raises_message
+from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
 from sqlalchemy.testing import is_instance_of
@@ -52,6 +56,72 @@ class NotAThing3(object):
 not_a_thing3 = NotAThing3()
 
 
+class IsLiteralTest(fixtures.TestBase):
+    def test_plain_object(self):
+        is_true(coercions._is_literal(not_a_thing1))
+
+    def test_plain_object_cached(self):
+        class Slotted(object):
+            __slots__ = ()
+
+        is_true(coercions._is_literal(Slotted()))
+        is_true(Slotted in coercions._NO_CLAUSE_ELEMENT_TYPES)
+        is_true(coercions._is_literal(Slotted()))
+
+    def test_instance_attribute_clause_element(self):
+        class Plain(object):
+            pass
+
+        has_attr = Plain()
+        has_attr.__clause_element__ = lambda: not_a_thing2
+
+        is_true(coercions._is_literal(Plain()))
+        is_(coercions._is_literal(has_attr), False)
+        is_true(Plain not in coercions._NO_CLAUSE_ELEMENT_TYPES)
+
+    def test_class_object(self):
+        class HasClassClauseElement(object):
+            @classmethod
+            def __clause_element__(cls):
+                return not_a_thing2
+
+        is_true(coercions._is_literal(NotAThing1))
+        is_(coercions._is_literal(HasClassClauseElement), False)
+        is_true(type not in coercions._NO_CLAUSE_ELEMENT_TYPES)
+
+    def test_clause_element(self):
+        is_(coercions._is_literal(not_a_thing2), False)
+        is_(coercions._is_literal(not_a_thing3), False)
+
+    def test_getattr_clause_element_per_instance(self):
+        class Proxy(object):
+            def __init__(self, target):
+                self.target = target
+
+            def __getattr__(self, key):
+                return getattr(self.target, key)
+
+        is_true(coercions._is_literal(Proxy(not_a_thing1)))
+        is_(coercions._is_literal(Proxy(not_a_thing3)), False)
+
+    def test_getattribute_clause_element_per_instance(self):
+        class Proxy(object):
+            __slots__ = ("target",)
+
+            def __init__(self, target):
+                self.target = target
+
+            def __getattribute__(self, key):
+                if key == "__clause_element__":
+                    target = object.__getattribute__(self, "target")
+                    return getattr(target, key)
+                return object.__getattribute__(self, key)
+
+        is_true(coercions._is_literal(Proxy(5)))
+        is_(coercions._is_literal(Proxy(not_a_thing3)), False)
+        is_true(Proxy not in coercions._NO_CLAUSE_ELEMENT_TYPES)
+
+
 class RoleTest(fixtures.TestBase):
     # TODO: the individual role tests here are incomplete.  The functionality
     # of each role is covered by other tests in the sql testing suite however
@@ -94,6 +164,20 @@ class RoleTest(fixtures.TestBase):
             argname="foo",
         )
 
+    def test_expected_error_args(self):
+        try:
+            expect(roles.WhereHavingRole, not_a_thing1, argname="foo")
+        except exc.ArgumentError as err:
+            eq_(
+                err.args,
+                (
+                    "SQL expression for WHERE/HAVING role expected for "
+                    "argument 'foo'; got %r." % not_a_thing1,
+                ),
+            )
+        else:
+            assert False
+
     def test_const_expr_role(self):
         t = true()
         is_(expect(roles.ConstExprRole, t), t)
@@ -195,6 +279,19 @@ class RoleTest(fixtures.TestBase):
         d1 = DDL("hi")
         is_(expect(roles.CoerceTextStatementRole, d1), d1)
 
+    def test_statement_subclass_role_coercion(self):
+        d1 = DDL("hi")
+        is_(expect(roles.DDLRole, d1), d1)
+
+        assert_raises_message(
+            exc.ArgumentError,
+            r"Executable SQL or text\(\) construct expected, "
+            r"got 'select \* from table'",
+            expect,
+            roles.DDLRole,
+            "select * from table",
+        )
+
     def test_strict_from_clause_role(self):
         stmt = select([t]).subquery()
         is_true(
@@ -235,6 +332,75 @@ class RoleTest(fixtures.TestBase):
     def test_columns_clause_role(self):
         is_(expect(roles.ColumnsClauseRole, t.c.q), t.c.q)
 
+    def test_expect_keyword_element(self):
+        is_(expect(roles.ColumnsClauseRole, element=t.c.q), t.c.q)
+
+        kw = {"element": None}
+        is_instance_of(expect(roles.ExpressionElementRole, **kw), Null)
+        eq_(kw, {"element": None})
+
+    def test_specialized_expect(self):
+        is_(coercions.expect_ColumnsClause(t.c.q), t.c.q)
+        is_instance_of(coercions.expect_WhereHaving(True), True_)
+
+        assert_raises_message(
+            exc.ArgumentError,
+            r"SQL expression for WHERE/HAVING role expected, "
+            r"got .*NotAThing1",
+            coercions.expect_WhereHaving,
+            not_a_thing1,
+        )
+
+    def test_specialized_expect_matches_expect(self):
+        def outcome(fn, *arg):
+            try:
+                result = fn(*arg)
+            except Exception as err:
+                return type(err), str(err)
+            else:
+                return type(result)
+
+        for role in coercions._impl_lookup:
+            specialized = getattr(
+                coercions, "expect_%s" % role.__name__.replace("Role", "")
+            )
+            for element in (
+                t,
+                t.c.q,
+                select([t.c.q]),
+                text("select 1"),
+                None,
+                True,
+                5,
+                "q",
+                not_a_thing1,
+                not_a_thing2,
+                not_a_thing3,
+            ):
+                eq_(
+                    outcome(specialized, element),
+                    outcome(expect, role, element),
+                )
+
+    def test_columns_clause_role_literals(self):
+        is_true(
+            expect(roles.ColumnsClauseRole, 5).compare(literal_column("5"))
+        )
+        is_true(
+            expect(roles.ColumnsClauseRole, "*").compare(literal_column("*"))
+        )
+        is_instance_of(expect(roles.ColumnsClauseRole, None), Null)
+        is_instance_of(expect(roles.ColumnsClauseRole, True), True_)
+        is_instance_of(expect(roles.ColumnsClauseRole, False), False_)
+
+        assert_raises_message(
+            exc.ArgumentError,
+            r"Textual column expression 'q' should be explicitly declared",
+            expect,
+            roles.ColumnsClauseRole,
+            quoted_name("q", None),
+        )
+
     def test_truncated_label_role_neg(self):
         self._test_role_neg_comparisons(roles.TruncatedLabelRole)
 
@@ -249,3 +415,115 @@ class RoleTest(fixtures.TestBase):
 
     def test_columns_clause_role_neg(self):
         self._test_role_neg_comparisons(roles.ColumnsClauseRole)
+
+
+class _ExpectTest(fixtures.TestBase):
+    def test_positional(self):
+        is_(self.module.expect(roles.ColumnsClauseRole, t.c.q), t.c.q)
+
+    def test_literal_coercion(self):
+        is_instance_of(self.module.expect(roles.WhereHavingRole, True), True_)
+
+    def test_post_coercion_keywords(self):
+        eq_(self.module.expect(roles.DMLColumnRole, t.c.q, as_key=True), "q")
+        is_(self.module.expect(roles.DMLColumnRole, t.c.q), t.c.q)
+
+    def test_implicit_coercion_keywords(self):
+        assert_raises_message(
+            exc.ArgumentError,
+            r"SQL expression for WHERE/HAVING role expected for "
+            r"argument 'foo'; got .*NotAThing1",
+            self.module.expect,
+            roles.WhereHavingRole,
+            not_a_thing1,
+            argname="foo",
+        )
+
+    def test_element_keyword(self):
+        is_(self.module.expect(roles.ColumnsClauseRole, element=t.c.q), t.c.q)
+
+    def test_role_and_element_keywords(self):
+        is_(
+            self.module.expect(role=roles.ColumnsClauseRole, element=t.c.q),
+            t.c.q,
+        )
+
+    def test_keywords_not_modified(self):
+        kw = {"role": roles.DMLColumnRole, "element": t.c.q, "as_key": True}
+        eq_(self.module.expect(**kw), "q")
+        eq_(
+            kw, {"role": roles.DMLColumnRole, "element": t.c.q, "as_key": True}
+        )
+
+    def test_missing_element(self):
+        assert_raises(TypeError, self.module.expect, roles.ColumnsClauseRole)
+        assert_raises(
+            TypeError, self.module.expect, role=roles.ColumnsClauseRole
+        )
+
+    def test_missing_role(self):
+        assert_raises(TypeError, self.module.expect)
+        assert_raises(TypeError, self.module.expect, element=t.c.q)
+
+    def test_too_many_positional(self):
+        assert_raises(
+            TypeError,
+            self.module.expect,
+            roles.ColumnsClauseRole,
+            t.c.q,
+            t.c.q,
+        )
+
+    def test_duplicate_role(self):
+        assert_raises_message(
+            TypeError,
+            r"multiple values for .*argument 'role'",
+            self.module.expect,
+            roles.ColumnsClauseRole,
+            t.c.q,
+            role=roles.ColumnsClauseRole,
+        )
+        assert_raises_message(
+            TypeError,
+            r"multiple values for .*argument 'role'",
+            self.module.expect,
+            roles.ColumnsClauseRole,
+            element=t.c.q,
+            role=roles.ColumnsClauseRole,
+        )
+
+    def test_duplicate_element(self):
+        assert_raises_message(
+            TypeError,
+            r"multiple values for .*argument 'element'",
+            self.module.expect,
+            roles.ColumnsClauseRole,
+            t.c.q,
+            element=t.c.q,
+        )
+
+    def test_unknown_role(self):
+        assert_raises(KeyError, self.module.expect, NotAThing1, t.c.q)
+
+
+class PyExpectTest(_ExpectTest):
+    @classmethod
+    def setup_class(cls):
+        cls.module = type(
+            "coercions",
+            (object,),
+            dict(
+                (k, staticmethod(v))
+                for k, v in list(coercions.py_fallback().items())
+            ),
+        )
+
+
+class CExpectTest(_ExpectTest):
+    __requires__ = ("cextensions",)
+
+    @classmethod
+    def setup_class(cls):
+        from sqlalchemy import ccoercions
+
+        cls.module = ccoercions